@@ -34,18 +34,22 @@ def env_list(name: str, default: list[str]) -> list[str]:
 def mask_uri(uri: Optional[str], keep: int = 6) -> Optional[str]:
     if not uri:
         return None
-    if len(uri) <= keep * 2:
-        return uri[:keep] + "..." + uri[-keep:]
     return uri[:keep] + "..." + uri[-keep:]
 
 
 PORT = int(os.getenv("PORT", os.getenv("RENDER_PORT", 8088)))
+WEB_CONCURRENCY = max(1, int(os.getenv("WEB_CONCURRENCY", 1)))
 APP_ENV = os.getenv("APP_ENV", "development")
 APP_NAME = os.getenv("APP_NAME", "Text Guard")
 APP_VERSION = os.getenv("APP_VERSION", "0.1.0")
 
 GROQ_API_KEY = os.getenv("GROQ_API_KEY")
 GROQ_MODEL = os.getenv("GROQ_MODEL", "llama-3.1-8b-instant")
+GROQ_ESCALATION_MODEL = os.getenv("GROQ_ESCALATION_MODEL", "llama-3.3-70b-versatile")
+GROQ_CONCURRENCY = int(os.getenv("GROQ_CONCURRENCY", 200))
+GROQ_MAX_TOKENS = int(os.getenv("GROQ_MAX_TOKENS", 160))
+GROQ_BATCH_SIZE = int(os.getenv("GROQ_BATCH_SIZE", 1))
+GROQ_BATCH_WINDOW_MS = float(os.getenv("GROQ_BATCH_WINDOW_MS", 10))
 HF_API_TOKEN = os.getenv("HF_API_TOKEN")
 HF_MODEL = os.getenv("HF_MODEL", "google/flan-t5-small")
 
@@ -54,6 +58,11 @@ MONGO_DB = os.getenv("MONGODB_DB", "text_guard")
 MONGO_COLLECTION = os.getenv("MONGODB_COLLECTION", "moderation_events")
 MONGO_TEST_CASES_COLLECTION = os.getenv("MONGODB_TEST_CASES_COLLECTION", "saved_test_cases")
 MONGO_POLICY_COLLECTION = os.getenv("MONGODB_POLICY_COLLECTION", "policy_presets")
+MONGO_ENSURE_INDEXES = env_flag("MONGO_ENSURE_INDEXES", True)
+
+EVENT_LOG_QUEUE_SIZE = int(os.getenv("EVENT_LOG_QUEUE_SIZE", 10_000))
+EVENT_LOG_BATCH_SIZE = int(os.getenv("EVENT_LOG_BATCH_SIZE", 500))
+EVENT_LOG_FLUSH_SECONDS = float(os.getenv("EVENT_LOG_FLUSH_SECONDS", 1.0))
 
 MOCK_MODE = env_flag("MOCK_MODE", False)
 ENABLE_DEBUG_ENV = env_flag("ENABLE_DEBUG_ENV", False)
@@ -62,8 +71,14 @@ CORS_ORIGINS = env_list("CORS_ORIGINS", ["http://localhost:5173", "http://127.0.
 DEFAULT_WORKSPACE_ID = os.getenv("DEFAULT_WORKSPACE_ID", "default")
 WORKSPACE_SHARED_KEY = os.getenv("WORKSPACE_SHARED_KEY", "")
 
+MODERATION_MIN_CHARS = int(os.getenv("MODERATION_MIN_CHARS", 3))
+MODERATION_MAX_MODEL_CHARS = int(os.getenv("MODERATION_MAX_MODEL_CHARS", 4000))
+MODERATION_CACHE_SIZE = int(os.getenv("MODERATION_CACHE_SIZE", 50_000))
+MODERATION_CACHE_TTL = int(os.getenv("MODERATION_CACHE_TTL", 3600))
+
 BLOCK_THRESHOLD = float(os.getenv("BLOCK_THRESHOLD", 0.85))
 REVIEW_THRESHOLD = float(os.getenv("REVIEW_THRESHOLD", 0.45))
+DEFAULT_POLICY = {"block_threshold": BLOCK_THRESHOLD, "review_threshold": REVIEW_THRESHOLD}
 
 logging.basicConfig(level=logging.INFO)
 LOG = logging.getLogger("text_guard")
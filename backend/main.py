@@ -1,7 +1,8 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from config import APP_NAME, APP_VERSION, CORS_ORIGINS, LOG, PORT
+from config import APP_NAME, APP_VERSION, CORS_ORIGINS, LOG, PORT, WEB_CONCURRENCY
+from providers import close_clients, start_clients
 from routes import router
 
 
@@ -16,8 +17,24 @@ app.add_middleware(
 app.include_router(router)
 
 
+@app.on_event("startup")
+async def on_startup() -> None:
+    await start_clients()
+
+
+@app.on_event("shutdown")
+async def on_shutdown() -> None:
+    await close_clients()
+
+
 if __name__ == "__main__":
-    LOG.info("Starting %s backend on port %s", APP_NAME, PORT)
+    LOG.info("Starting %s backend on port %s with %s workers", APP_NAME, PORT, WEB_CONCURRENCY)
     import uvicorn
 
-    uvicorn.run("main:app", host="0.0.0.0", port=PORT, reload=False)
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=PORT,
+        reload=False,
+        workers=WEB_CONCURRENCY,
+    )
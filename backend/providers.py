@@ -1,11 +1,23 @@
-import json
+import asyncio
+import hashlib
 import re
 from typing import Any, Optional
 
+import orjson
+
 from config import (
     APP_ENV,
+    BLOCK_THRESHOLD,
     DEFAULT_WORKSPACE_ID,
+    EVENT_LOG_BATCH_SIZE,
+    EVENT_LOG_FLUSH_SECONDS,
+    EVENT_LOG_QUEUE_SIZE,
     GROQ_API_KEY,
+    GROQ_BATCH_SIZE,
+    GROQ_BATCH_WINDOW_MS,
+    GROQ_CONCURRENCY,
+    GROQ_ESCALATION_MODEL,
+    GROQ_MAX_TOKENS,
     GROQ_MODEL,
     HF_API_TOKEN,
     HF_MODEL,
@@ -13,9 +25,14 @@ from config import (
     LOG_ALL_DECISIONS,
     MONGO_COLLECTION,
     MONGO_DB,
+    MONGO_ENSURE_INDEXES,
     MONGO_POLICY_COLLECTION,
     MONGO_TEST_CASES_COLLECTION,
     MONGO_URI,
+    MODERATION_CACHE_SIZE,
+    MODERATION_CACHE_TTL,
+    REVIEW_THRESHOLD,
+    WEB_CONCURRENCY,
     mask_uri,
 )
 from rules import LABEL_TO_CATEGORY, empty_categories
@@ -26,51 +43,157 @@ except Exception:
     ObjectId = None
 
 try:
-    from pymongo import MongoClient
-    from pymongo.collection import ReturnDocument
+    from pymongo import AsyncMongoClient, InsertOne, ReturnDocument, UpdateOne
 except Exception:
-    MongoClient = None
+    AsyncMongoClient = None
+    InsertOne = None
     ReturnDocument = None
+    UpdateOne = None
+
+try:
+    from groq import AsyncGroq
+except Exception:
+    AsyncGroq = None
 
 try:
-    from groq import Groq
+    import httpx
 except Exception:
-    Groq = None
+    httpx = None
 
 try:
-    import requests
+    from cachetools import TTLCache
 except Exception:
-    requests = None
+    TTLCache = None
+
+
+MODERATION_SCHEMA = (
+    "label:hate|harassment|sexual|violence|self_harm|spam|other, score:0-1, matched_seed:str|null, categories:{label:score}. "
+    "Count obfuscated abuse (k y s, p0rn, 1d10t)."
+)
+MODERATION_SYSTEM = "Moderate the message. Return JSON {label,score,matched_seed,categories} in that order. " + MODERATION_SCHEMA
+MODERATION_BATCH_SYSTEM = (
+    "Moderate each numbered message independently. "
+    'Return JSON {"results":[{id,label,score,matched_seed,categories}]}, id = message number. ' + MODERATION_SCHEMA
+)
+ESCALATION_ENABLED = bool(GROQ_ESCALATION_MODEL) and GROQ_ESCALATION_MODEL != GROQ_MODEL
+JSON_OBJECT_RE = re.compile(r"\{.*\}", re.DOTALL)
+STREAM_LABEL_RE = re.compile(r'"label"\s*:\s*"([^"]*)"')
+STREAM_SCORE_RE = re.compile(r'"score"\s*:\s*([0-9]*\.?[0-9]+)\s*[,}]')
+
+MAX_EVENT_LIST_LIMIT = 500
+MAX_EVENT_ANALYTICS_LIMIT = 5000
+EVENT_LIST_PROJECTION = {
+    field: 1
+    for field in (
+        "ts", "workspace_id", "raw", "action", "score", "reason", "matched_seed", "categories", "flags",
+        "provider", "mode", "latency_ms", "meta", "review_status", "review", "review_assignment", "count", "first_ts",
+    )
+}
+EVENT_ANALYTICS_PROJECTION = {
+    field: 1
+    for field in ("ts", "workspace_id", "action", "categories", "flags", "review_status", "review", "count", "first_ts")
+}
 
 
 groq_client = None
-if GROQ_API_KEY and Groq is not None:
-    try:
-        groq_client = Groq(api_key=GROQ_API_KEY)
-        LOG.info("Groq client created.")
-    except Exception as exc:
-        LOG.warning("Failed to create Groq client: %s", exc)
-else:
-    if GROQ_API_KEY:
-        LOG.warning("Groq package not installed; GROQ_API_KEY ignored.")
+http_client = None
+upstream_slots: Optional[asyncio.Semaphore] = None
+moderation_cache = (
+    TTLCache(maxsize=MODERATION_CACHE_SIZE, ttl=MODERATION_CACHE_TTL)
+    if TTLCache is not None and MODERATION_CACHE_SIZE > 0
+    else None
+)
+_pending_batch: list[tuple[str, asyncio.Future]] = []
+_batch_timer: Optional[asyncio.TimerHandle] = None
+_batch_tasks: set[asyncio.Task] = set()
+
+mongo_client = None
+event_queue: Optional[asyncio.Queue] = None
+_event_worker: Optional[asyncio.Task] = None
+dropped_events = 0
+EVENT_LOG_STOP: Any = object()
+
+
+async def start_clients() -> None:
+    global groq_client, http_client, upstream_slots, mongo_client, event_queue, _event_worker
+
+    connections = max(1, GROQ_CONCURRENCY // WEB_CONCURRENCY)
+    upstream_slots = asyncio.Semaphore(connections)
+    if httpx is not None:
+        http_client = httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(60.0, connect=5.0),
+            limits=httpx.Limits(max_keepalive_connections=connections, max_connections=connections),
+        )
+
+    if GROQ_API_KEY and AsyncGroq is not None:
+        try:
+            groq_client = AsyncGroq(api_key=GROQ_API_KEY, http_client=http_client)
+            LOG.info("Groq client created.")
+        except Exception as exc:
+            LOG.warning("Failed to create Groq client: %s", exc)
     else:
-        LOG.info("GROQ_API_KEY not set; Groq disabled.")
+        if GROQ_API_KEY:
+            LOG.warning("Groq package not installed; GROQ_API_KEY ignored.")
+        else:
+            LOG.info("GROQ_API_KEY not set; Groq disabled.")
 
+    if MONGO_URI and AsyncMongoClient is not None:
+        try:
+            mongo_client = AsyncMongoClient(MONGO_URI, serverSelectionTimeoutMS=5000, connectTimeoutMS=5000)
+            await mongo_client.server_info()
+            LOG.info("Connected to MongoDB (masked): %s", mask_uri(MONGO_URI))
+        except Exception as exc:
+            LOG.warning("MongoDB connection failed: %s. Masked URI: %s", exc, mask_uri(MONGO_URI))
+            mongo_client = None
+    else:
+        if MONGO_URI:
+            LOG.warning("pymongo not installed; MONGO_URI ignored.")
+        else:
+            LOG.info("No Mongo URI provided; Mongo logging disabled.")
+
+    if mongo_client is not None:
+        if MONGO_ENSURE_INDEXES:
+            await ensure_indexes()
+        event_queue = asyncio.Queue(maxsize=EVENT_LOG_QUEUE_SIZE)
+        _event_worker = asyncio.get_running_loop().create_task(_event_log_worker())
+
+
+async def close_clients() -> None:
+    global groq_client, http_client, mongo_client, event_queue, _event_worker
+
+    if _event_worker is not None:
+        if not _event_worker.done():
+            await event_queue.put(EVENT_LOG_STOP)
+        await _event_worker
+        _event_worker = None
+    if event_queue is not None:
+        remaining = []
+        while not event_queue.empty():
+            remaining.append(event_queue.get_nowait())
+        if remaining:
+            await _write_events(remaining)
+        event_queue = None
+    if mongo_client is not None:
+        await mongo_client.close()
+        mongo_client = None
 
-mongo_client = None
-if MONGO_URI and MongoClient is not None:
+    if groq_client is not None:
+        await groq_client.close()
+        groq_client = None
+    if http_client is not None:
+        await http_client.aclose()
+        http_client = None
+
+
+async def ensure_indexes() -> None:
+    events = mongo_client[MONGO_DB][MONGO_COLLECTION]
     try:
-        mongo_client = MongoClient(MONGO_URI, serverSelectionTimeoutMS=5000, connectTimeoutMS=5000)
-        mongo_client.server_info()
-        LOG.info("Connected to MongoDB (masked): %s", mask_uri(MONGO_URI))
+        await events.create_index([("ts", -1)])
+        await events.create_index([("action", 1), ("ts", -1)])
+        await events.create_index([("fingerprint", 1)])
     except Exception as exc:
-        LOG.warning("MongoDB connection failed: %s. Masked URI: %s", exc, mask_uri(MONGO_URI))
-        mongo_client = None
-else:
-    if MONGO_URI:
-        LOG.warning("pymongo not installed; MONGO_URI ignored.")
-    else:
-        LOG.info("No Mongo URI provided; Mongo logging disabled.")
+        LOG.warning("Failed to create Mongo indexes: %s", exc)
 
 
 def provider_status() -> dict[str, bool]:
@@ -81,6 +204,13 @@ def provider_status() -> dict[str, bool]:
     }
 
 
+def event_log_status() -> dict[str, int]:
+    return {
+        "queued": event_queue.qsize() if event_queue is not None else 0,
+        "dropped": dropped_events,
+    }
+
+
 def parse_llm_payload(payload: Any) -> tuple[dict[str, float], Optional[str]]:
     if not isinstance(payload, dict):
         return empty_categories(), None
@@ -110,20 +240,20 @@ def parse_llm_payload(payload: Any) -> tuple[dict[str, float], Optional[str]]:
     return categories, matched_seed if isinstance(matched_seed, str) else None
 
 
-def call_hf_inference(prompt: str, model: str, token: str, max_tokens: int = 180, temperature: float = 0.0) -> dict[str, Any]:
-    if not requests:
-        raise RuntimeError("requests not available in environment")
+async def call_hf_inference(prompt: str, model: str, token: str, max_tokens: int = 180, temperature: float = 0.0) -> dict[str, Any]:
+    if http_client is None:
+        raise RuntimeError("httpx not available in environment")
 
-    response = requests.post(
-        f"https://api-inference.huggingface.co/models/{model}",
-        headers={"Authorization": f"Bearer {token}"},
-        json={"inputs": prompt, "parameters": {"max_new_tokens": max_tokens, "temperature": temperature}},
-        timeout=60,
-    )
+    async with upstream_slots:
+        response = await http_client.post(
+            f"https://api-inference.huggingface.co/models/{model}",
+            headers={"Authorization": f"Bearer {token}"},
+            json={"inputs": prompt, "parameters": {"max_new_tokens": max_tokens, "temperature": temperature}},
+        )
     if response.status_code != 200:
         raise RuntimeError(f"HuggingFace API returned {response.status_code}: {response.text}")
 
-    data = response.json()
+    data = orjson.loads(response.content)
     if isinstance(data, list) and data and isinstance(data[0], dict) and "generated_text" in data[0]:
         text = data[0]["generated_text"]
     elif isinstance(data, dict) and "generated_text" in data:
@@ -131,61 +261,237 @@ def call_hf_inference(prompt: str, model: str, token: str, max_tokens: int = 180
     else:
         text = str(data)
 
+    return parse_json_text(text, "HuggingFace")
+
+
+def parse_json_text(text: str, source: str) -> Any:
     try:
-        return json.loads(text)
+        return orjson.loads(text)
     except Exception:
-        match = re.search(r"\{.*\}", text, flags=re.DOTALL)
+        match = JSON_OBJECT_RE.search(text)
         if not match:
-            raise RuntimeError("HuggingFace response was not valid JSON")
-        return json.loads(match.group(0))
-
-
-def run_llm_moderation(text: str) -> tuple[dict[str, float], Optional[str], str, Optional[str]]:
-    prompt = (
-        "You are a content moderation system. "
-        "Detect direct abuse, obfuscated abuse, spaced-out slurs, misspelled threats, manipulative coercion, scam pressure, and attempts to evade moderation. "
-        "Treat disguised spellings like 'k y s', 'p0rn', '1d10t', or symbol swaps as meaningful if the intent is clear. "
-        "Return only valid JSON with keys: "
-        "'score' (0.0-1.0), 'label' (hate|harassment|sexual|violence|self_harm|spam|other), "
-        "'matched_seed' (string or null), and 'categories' (object with the same labels and scores 0.0-1.0). "
-        f'Message: """{text}"""'
-    )
+            raise RuntimeError(f"{source} response was not valid JSON")
+        return orjson.loads(match.group(0))
 
-    if groq_client is not None:
-        response = groq_client.chat.completions.create(
+
+def moderation_cache_key(text: str) -> str:
+    return hashlib.blake2b(text.strip().lower().encode("utf-8"), digest_size=16).hexdigest()
+
+
+async def run_llm_moderation(text: str) -> tuple[dict[str, float], Optional[str], str, Optional[str]]:
+    key = moderation_cache_key(text)
+    if moderation_cache is not None:
+        cached = moderation_cache.get(key)
+        if cached is not None:
+            categories, matched_seed, provider, model = cached
+            return dict(categories), matched_seed, provider, model
+
+    categories, matched_seed, provider, model = await _query_llm(text)
+    if moderation_cache is not None and provider != "none":
+        moderation_cache[key] = (dict(categories), matched_seed, provider, model)
+    return categories, matched_seed, provider, model
+
+
+def single_moderation_prompt(text: str) -> str:
+    return f"{MODERATION_SYSTEM}\nMessage: {text}"
+
+
+def _completion_text(response: Any) -> Optional[str]:
+    llm_text = None
+    if getattr(response, "choices", None):
+        choice = response.choices[0]
+        message = getattr(choice, "message", None)
+        if message is not None:
+            llm_text = getattr(message, "content", None) or (message.get("content") if isinstance(message, dict) else None)
+        if llm_text is None:
+            llm_text = getattr(choice, "text", None) or (choice.get("text") if isinstance(choice, dict) else None)
+    return llm_text
+
+
+def _in_escalation_band(score: float) -> bool:
+    return REVIEW_THRESHOLD - 0.1 <= score <= BLOCK_THRESHOLD + 0.05
+
+
+def _early_decision(buffer: str, escalating: bool) -> Optional[dict[str, Any]]:
+    label_match = STREAM_LABEL_RE.search(buffer)
+    score_match = STREAM_SCORE_RE.search(buffer)
+    if label_match is None or score_match is None:
+        return None
+
+    score = float(score_match.group(1))
+    label = label_match.group(1)
+    if label.strip().lower() not in LABEL_TO_CATEGORY:
+        return None
+    if REVIEW_THRESHOLD <= score < BLOCK_THRESHOLD:
+        return None
+    if escalating and _in_escalation_band(score):
+        return None
+    return {"label": label, "score": score, "matched_seed": None}
+
+
+async def _groq_json(system: str, content: str, max_tokens: int, model: str = GROQ_MODEL) -> Any:
+    async with upstream_slots:
+        response = await groq_client.chat.completions.create(
             messages=[
-                {"role": "system", "content": "You are a precise JSON-only moderation assistant."},
-                {"role": "user", "content": prompt},
+                {"role": "system", "content": system},
+                {"role": "user", "content": content},
             ],
-            model=GROQ_MODEL,
+            model=model,
             temperature=0.0,
+            max_tokens=max_tokens,
             response_format={"type": "json_object"},
         )
-        llm_text = None
-        if getattr(response, "choices", None):
-            choice = response.choices[0]
-            message = getattr(choice, "message", None)
-            if message is not None:
-                llm_text = getattr(message, "content", None) or (message.get("content") if isinstance(message, dict) else None)
-            if llm_text is None:
-                llm_text = getattr(choice, "text", None) or (choice.get("text") if isinstance(choice, dict) else None)
-        payload = json.loads(llm_text) if isinstance(llm_text, str) else llm_text
+    llm_text = _completion_text(response)
+    return orjson.loads(llm_text) if isinstance(llm_text, str) else llm_text
+
+
+async def _groq_moderate_one(text: str, model: str = GROQ_MODEL) -> Any:
+    escalating = ESCALATION_ENABLED and model == GROQ_MODEL
+    async with upstream_slots:
+        stream = await groq_client.chat.completions.create(
+            messages=[
+                {"role": "system", "content": MODERATION_SYSTEM},
+                {"role": "user", "content": text},
+            ],
+            model=model,
+            temperature=0.0,
+            max_tokens=GROQ_MAX_TOKENS,
+            stream=True,
+        )
+        buffer = ""
+        try:
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                buffer += chunk.choices[0].delta.content or ""
+                early = _early_decision(buffer, escalating)
+                if early is not None:
+                    return early
+        finally:
+            await stream.close()
+        return parse_json_text(buffer, "Groq")
+
+
+async def _groq_moderate_many(texts: list[str]) -> list[Optional[Any]]:
+    messages = "\n".join(f"{index}: {orjson.dumps(text).decode()}" for index, text in enumerate(texts))
+    try:
+        payload = await _groq_json(MODERATION_BATCH_SYSTEM, messages, GROQ_MAX_TOKENS * len(texts))
+    except ValueError as exc:
+        LOG.warning("Groq batch response was not valid JSON: %s", exc)
+        payload = None
+    results = payload.get("results") if isinstance(payload, dict) else None
+    if not isinstance(results, list):
+        results = []
+
+    by_id: dict[int, Any] = {}
+    duplicates: set[int] = set()
+    for item in results:
+        if not isinstance(item, dict):
+            continue
+        try:
+            item_id = int(item.get("id"))
+        except Exception:
+            continue
+        if item_id in by_id:
+            duplicates.add(item_id)
+        by_id[item_id] = item
+    return [by_id.get(index) if index not in duplicates else None for index in range(len(texts))]
+
+
+async def _run_batch(batch: list[tuple[str, asyncio.Future]]) -> None:
+    texts = [text for text, _ in batch]
+    try:
+        if len(batch) == 1:
+            payloads: list[Optional[Any]] = [await _groq_moderate_one(texts[0])]
+        else:
+            payloads = await _groq_moderate_many(texts)
+    except Exception as exc:
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(exc)
+        return
+
+    missing = [index for index, payload in enumerate(payloads) if payload is None]
+    if missing:
+        LOG.warning("Groq batch response missing ids %s; retrying them individually", missing)
+        retried = await asyncio.gather(*(_groq_moderate_one(texts[index]) for index in missing), return_exceptions=True)
+        for index, payload in zip(missing, retried):
+            payloads[index] = payload
+
+    for (_, future), payload in zip(batch, payloads):
+        if future.done():
+            continue
+        if isinstance(payload, Exception):
+            future.set_exception(payload)
+        else:
+            future.set_result(payload)
+
+
+def _flush_batch() -> None:
+    global _pending_batch, _batch_timer
+
+    if _batch_timer is not None:
+        _batch_timer.cancel()
+        _batch_timer = None
+    batch, _pending_batch = _pending_batch, []
+    if not batch:
+        return
+
+    task = asyncio.get_running_loop().create_task(_run_batch(batch))
+    _batch_tasks.add(task)
+    task.add_done_callback(_batch_tasks.discard)
+
+
+async def request_groq_moderation(text: str) -> Any:
+    global _batch_timer
+
+    if GROQ_BATCH_SIZE <= 1:
+        return await _groq_moderate_one(text)
+
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    _pending_batch.append((text, future))
+    if len(_pending_batch) >= GROQ_BATCH_SIZE:
+        _flush_batch()
+    elif _batch_timer is None:
+        _batch_timer = loop.call_later(GROQ_BATCH_WINDOW_MS / 1000, _flush_batch)
+    return await future
+
+
+def _needs_escalation(payload: Any, categories: dict[str, float]) -> bool:
+    label = payload.get("label") if isinstance(payload, dict) else None
+    if label is not None and str(label).strip().lower() not in LABEL_TO_CATEGORY:
+        return True
+    return _in_escalation_band(max(categories.values()) if categories else 0.0)
+
+
+async def _query_llm(text: str) -> tuple[dict[str, float], Optional[str], str, Optional[str]]:
+    if groq_client is not None:
+        payload = await request_groq_moderation(text)
         categories, matched_seed = parse_llm_payload(payload)
+        if ESCALATION_ENABLED and _needs_escalation(payload, categories):
+            try:
+                escalated = await _groq_moderate_one(text, model=GROQ_ESCALATION_MODEL)
+            except Exception as exc:
+                LOG.warning("Escalation to %s failed; keeping %s verdict: %s", GROQ_ESCALATION_MODEL, GROQ_MODEL, exc)
+                return categories, matched_seed, "groq", GROQ_MODEL
+            categories, matched_seed = parse_llm_payload(escalated)
+            return categories, matched_seed, "groq", GROQ_ESCALATION_MODEL
         return categories, matched_seed, "groq", GROQ_MODEL
 
     if HF_API_TOKEN:
-        payload = call_hf_inference(prompt, HF_MODEL, HF_API_TOKEN)
+        payload = await call_hf_inference(single_moderation_prompt(text), HF_MODEL, HF_API_TOKEN)
         categories, matched_seed = parse_llm_payload(payload)
         return categories, matched_seed, "huggingface", HF_MODEL
 
     return empty_categories(), None, "none", None
 
 
-def save_event(event: dict[str, Any]) -> bool:
+async def save_event(event: dict[str, Any]) -> bool:
     if mongo_client is None:
         return False
     try:
-        mongo_client[MONGO_DB][MONGO_COLLECTION].insert_one(event)
+        await mongo_client[MONGO_DB][MONGO_COLLECTION].insert_one(event)
         return True
     except Exception as exc:
         LOG.warning("Failed to write log to Mongo: %s", exc)
@@ -193,9 +499,87 @@ def save_event(event: dict[str, Any]) -> bool:
 
 
 def log_event(event: dict[str, Any]) -> bool:
+    global dropped_events
+
     if not LOG_ALL_DECISIONS and event.get("action") != "block":
         return False
-    return save_event(event)
+    if event_queue is None:
+        return False
+    try:
+        event_queue.put_nowait(event)
+        return True
+    except asyncio.QueueFull:
+        dropped_events += 1
+        if dropped_events % 1000 == 1:
+            LOG.warning("Event log queue full; %d events dropped so far", dropped_events)
+        return False
+
+
+def event_fingerprint(event: dict[str, Any]) -> str:
+    key = f"{event.get('workspace_id') or DEFAULT_WORKSPACE_ID}\0{event.get('raw', '')}"
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _event_write_ops(events: list[dict[str, Any]]) -> list[Any]:
+    ops: list[Any] = []
+    blocks: dict[str, tuple[dict[str, Any], int, int]] = {}
+    for event in events:
+        if event.get("action") != "block":
+            ops.append(InsertOne(event))
+            continue
+        fingerprint = event_fingerprint(event)
+        _, count, first_ts = blocks.get(fingerprint, (event, 0, event.get("ts")))
+        blocks[fingerprint] = (event, count + 1, first_ts)
+
+    for fingerprint, (event, count, first_ts) in blocks.items():
+        fields = {key: value for key, value in event.items() if key != "action"}
+        ops.append(
+            UpdateOne(
+                {"fingerprint": fingerprint, "review": {"$exists": False}},
+                {
+                    "$set": fields,
+                    "$inc": {"count": count},
+                    "$setOnInsert": {"first_ts": first_ts, "action": event["action"]},
+                },
+                upsert=True,
+            )
+        )
+    return ops
+
+
+async def _write_events(events: list[dict[str, Any]]) -> None:
+    try:
+        await mongo_client[MONGO_DB][MONGO_COLLECTION].bulk_write(_event_write_ops(events), ordered=False)
+    except Exception as exc:
+        LOG.warning("Failed to write %d log events to Mongo: %s", len(events), exc)
+
+
+async def _event_log_worker() -> None:
+    loop = asyncio.get_running_loop()
+    while True:
+        event = await event_queue.get()
+        if event is EVENT_LOG_STOP:
+            return
+
+        batch = [event]
+        stopping = False
+        deadline = loop.time() + EVENT_LOG_FLUSH_SECONDS
+        while len(batch) < EVENT_LOG_BATCH_SIZE:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                event = await asyncio.wait_for(event_queue.get(), timeout)
+            except asyncio.TimeoutError:
+                break
+            if event is EVENT_LOG_STOP:
+                stopping = True
+                break
+            batch.append(event)
+
+        await _write_events(batch)
+        if stopping:
+            return
 
 
 def _matches_workspace(document: dict[str, Any], workspace_id: str) -> bool:
@@ -205,7 +589,7 @@ def _matches_workspace(document: dict[str, Any], workspace_id: str) -> bool:
     return workspace_id == DEFAULT_WORKSPACE_ID
 
 
-def fetch_events(limit: int = 50, action: Optional[str] = None, workspace_id: str = DEFAULT_WORKSPACE_ID) -> list[dict[str, Any]]:
+async def fetch_events(limit: int = 50, action: Optional[str] = None, workspace_id: str = DEFAULT_WORKSPACE_ID) -> list[dict[str, Any]]:
     if mongo_client is None:
         raise RuntimeError("MongoDB not configured")
 
@@ -213,31 +597,33 @@ def fetch_events(limit: int = 50, action: Optional[str] = None, workspace_id: st
     if action:
         query["action"] = action
 
-    cursor = mongo_client[MONGO_DB][MONGO_COLLECTION].find(query).sort("ts", -1).limit(int(limit))
-    items = []
-    for item in cursor:
-        if not _matches_workspace(item, workspace_id):
-            continue
-        item["_id"] = str(item["_id"])
-        items.append(item)
-    return items
+    limit = max(1, min(int(limit), MAX_EVENT_LIST_LIMIT))
+    cursor = (
+        mongo_client[MONGO_DB][MONGO_COLLECTION]
+        .find(query, projection=EVENT_LIST_PROJECTION)
+        .sort("ts", -1)
+        .limit(limit)
+        .batch_size(limit)
+    )
+    return [{**item, "_id": str(item["_id"])} async for item in cursor if _matches_workspace(item, workspace_id)]
 
 
-def fetch_all_events(limit: int = 500, workspace_id: str = DEFAULT_WORKSPACE_ID) -> list[dict[str, Any]]:
+async def fetch_all_events(limit: int = 500, workspace_id: str = DEFAULT_WORKSPACE_ID) -> list[dict[str, Any]]:
     if mongo_client is None:
         raise RuntimeError("MongoDB not configured")
 
-    cursor = mongo_client[MONGO_DB][MONGO_COLLECTION].find().sort("ts", -1).limit(int(limit))
-    items = []
-    for item in cursor:
-        if not _matches_workspace(item, workspace_id):
-            continue
-        item["_id"] = str(item["_id"])
-        items.append(item)
-    return items
+    limit = max(1, min(int(limit), MAX_EVENT_ANALYTICS_LIMIT))
+    cursor = (
+        mongo_client[MONGO_DB][MONGO_COLLECTION]
+        .find(projection=EVENT_ANALYTICS_PROJECTION)
+        .sort("ts", -1)
+        .limit(limit)
+        .batch_size(limit)
+    )
+    return [{**item, "_id": str(item["_id"])} async for item in cursor if _matches_workspace(item, workspace_id)]
 
 
-def update_event(event_id: str, updates: dict[str, Any], workspace_id: str = DEFAULT_WORKSPACE_ID) -> Optional[dict[str, Any]]:
+async def update_event(event_id: str, updates: dict[str, Any], workspace_id: str = DEFAULT_WORKSPACE_ID) -> Optional[dict[str, Any]]:
     if mongo_client is None:
         raise RuntimeError("MongoDB not configured")
     if ObjectId is None or ReturnDocument is None:
@@ -255,7 +641,7 @@ def update_event(event_id: str, updates: dict[str, Any], workspace_id: str = DEF
     else:
         query["workspace_id"] = workspace_id
 
-    result = mongo_client[MONGO_DB][MONGO_COLLECTION].find_one_and_update(
+    result = await mongo_client[MONGO_DB][MONGO_COLLECTION].find_one_and_update(
         query,
         payload,
         return_document=ReturnDocument.AFTER,
@@ -266,50 +652,38 @@ def update_event(event_id: str, updates: dict[str, Any], workspace_id: str = DEF
     return result
 
 
-def save_test_case(document: dict[str, Any]) -> Optional[dict[str, Any]]:
+async def save_test_case(document: dict[str, Any]) -> Optional[dict[str, Any]]:
     if mongo_client is None:
         raise RuntimeError("MongoDB not configured")
-    result = mongo_client[MONGO_DB][MONGO_TEST_CASES_COLLECTION].insert_one(document)
-    saved = mongo_client[MONGO_DB][MONGO_TEST_CASES_COLLECTION].find_one({"_id": result.inserted_id})
+    result = await mongo_client[MONGO_DB][MONGO_TEST_CASES_COLLECTION].insert_one(document)
+    saved = await mongo_client[MONGO_DB][MONGO_TEST_CASES_COLLECTION].find_one({"_id": result.inserted_id})
     if saved is None:
         return None
     saved["_id"] = str(saved["_id"])
     return saved
 
 
-def fetch_test_cases(limit: int = 100, workspace_id: str = DEFAULT_WORKSPACE_ID) -> list[dict[str, Any]]:
+async def fetch_test_cases(limit: int = 100, workspace_id: str = DEFAULT_WORKSPACE_ID) -> list[dict[str, Any]]:
     if mongo_client is None:
         raise RuntimeError("MongoDB not configured")
 
     cursor = mongo_client[MONGO_DB][MONGO_TEST_CASES_COLLECTION].find().sort("created_at", -1).limit(int(limit))
-    items = []
-    for item in cursor:
-        if not _matches_workspace(item, workspace_id):
-            continue
-        item["_id"] = str(item["_id"])
-        items.append(item)
-    return items
+    return [{**item, "_id": str(item["_id"])} async for item in cursor if _matches_workspace(item, workspace_id)]
 
 
-def fetch_policy_presets(workspace_id: str = DEFAULT_WORKSPACE_ID) -> list[dict[str, Any]]:
+async def fetch_policy_presets(workspace_id: str = DEFAULT_WORKSPACE_ID) -> list[dict[str, Any]]:
     if mongo_client is None:
         raise RuntimeError("MongoDB not configured")
 
     cursor = mongo_client[MONGO_DB][MONGO_POLICY_COLLECTION].find().sort("name", 1)
-    items = []
-    for item in cursor:
-        if not _matches_workspace(item, workspace_id):
-            continue
-        item["_id"] = str(item["_id"])
-        items.append(item)
-    return items
+    return [{**item, "_id": str(item["_id"])} async for item in cursor if _matches_workspace(item, workspace_id)]
 
 
-def upsert_policy_preset(workspace_id: str, preset_id: str, document: dict[str, Any]) -> Optional[dict[str, Any]]:
+async def upsert_policy_preset(workspace_id: str, preset_id: str, document: dict[str, Any]) -> Optional[dict[str, Any]]:
     if mongo_client is None:
         raise RuntimeError("MongoDB not configured")
 
-    result = mongo_client[MONGO_DB][MONGO_POLICY_COLLECTION].find_one_and_update(
+    result = await mongo_client[MONGO_DB][MONGO_POLICY_COLLECTION].find_one_and_update(
         {"workspace_id": workspace_id, "preset_id": preset_id},
         {"$set": document},
         upsert=True,
@@ -1,7 +1,8 @@
 import time
-from typing import Any, Optional
+from typing import Annotated, Any, Optional
 
-from fastapi import APIRouter, Header, HTTPException
+import msgspec
+from fastapi import APIRouter, Header, HTTPException, Request, Response
 from pydantic import BaseModel, Field
 
 from config import (
@@ -9,15 +10,19 @@ from config import (
     APP_NAME,
     APP_VERSION,
     BLOCK_THRESHOLD,
+    DEFAULT_POLICY,
     DEFAULT_WORKSPACE_ID,
     ENABLE_DEBUG_ENV,
     LOG,
     MOCK_MODE,
+    MODERATION_MAX_MODEL_CHARS,
+    MODERATION_MIN_CHARS,
     REVIEW_THRESHOLD,
     WORKSPACE_SHARED_KEY,
 )
 from providers import (
     debug_env_payload,
+    event_log_status,
     fetch_all_events,
     fetch_events,
     fetch_policy_presets,
@@ -34,14 +39,15 @@ from rules import choose_action, detect_rule_signals, empty_categories, merge_ca
 
 
 router = APIRouter()
+shortcut_counts = {"too_short": 0, "too_long": 0}
 
 
-class ModerateRequest(BaseModel):
-    text: str = Field(..., min_length=0, max_length=5000)
-    mode: str = Field(default="comment")
+class ModerateRequest(msgspec.Struct):
+    text: Annotated[str, msgspec.Meta(max_length=5000)]
+    mode: str = "comment"
 
 
-class ModerateResponse(BaseModel):
+class ModerateResponse(msgspec.Struct, kw_only=True):
     action: str
     score: float
     reason: str
@@ -55,6 +61,61 @@ class ModerateResponse(BaseModel):
     latency_ms: int
 
 
+def json_schema(struct: type) -> dict[str, Any]:
+    schema = msgspec.json.schema(struct)
+    return schema["$defs"][struct.__name__]
+
+
+MODERATE_OPENAPI_EXTRA = {
+    "requestBody": {
+        "required": True,
+        "content": {"application/json": {"schema": json_schema(ModerateRequest)}},
+    }
+}
+MODERATE_RESPONSES: dict[int | str, dict[str, Any]] = {
+    200: {
+        "description": "Moderation decision",
+        "content": {"application/json": {"schema": json_schema(ModerateResponse)}},
+    }
+}
+
+
+def encode_moderation(response: ModerateResponse) -> Response:
+    return Response(content=msgspec.json.encode(response), media_type="application/json")
+
+
+def shortcut_result(
+    action: str,
+    score: float,
+    reason: str,
+    mode: str,
+    started: float,
+    provider: str = "none",
+    categories: Optional[dict[str, float]] = None,
+    flags: Optional[list[str]] = None,
+    matched_seed: Optional[str] = None,
+) -> ModerateResponse:
+    return ModerateResponse(
+        action=action,
+        score=score,
+        reason=reason,
+        matched_seed=matched_seed,
+        categories=categories if categories is not None else empty_categories(),
+        flags=flags or [],
+        policy=DEFAULT_POLICY,
+        provider=provider,
+        model=None,
+        mode=mode,
+        latency_ms=round((time.perf_counter() - started) * 1000),
+    )
+
+
+def record_moderation(response: ModerateResponse, workspace_id: str, text: str) -> Response:
+    payload = msgspec.structs.asdict(response)
+    log_event({"ts": int(time.time()), "workspace_id": workspace_id, "raw": text, **payload, "meta": {"environment": APP_ENV}})
+    return encode_moderation(response)
+
+
 class ReviewSubmissionRequest(BaseModel):
     text: str = Field(..., min_length=1, max_length=5000)
     mode: str = Field(default="comment")
@@ -121,6 +182,8 @@ def health() -> dict[str, Any]:
         "environment": APP_ENV,
         "version": APP_VERSION,
         "providers": provider_status(),
+        "event_log": event_log_status(),
+        "shortcuts": dict(shortcut_counts),
         "mock_mode": MOCK_MODE,
         "time_utc": time.time(),
     }
@@ -133,56 +196,58 @@ def debug_env() -> dict[str, Any]:
     return debug_env_payload()
 
 
-@router.post("/moderate", response_model=ModerateResponse)
-def moderate(
-    req: ModerateRequest,
+@router.post("/moderate", openapi_extra=MODERATE_OPENAPI_EXTRA, responses=MODERATE_RESPONSES)
+async def moderate(
+    request: Request,
     x_workspace_id: Optional[str] = Header(default=None, alias="X-Workspace-Id"),
     x_workspace_key: Optional[str] = Header(default=None, alias="X-Workspace-Key"),
-) -> ModerateResponse:
+) -> Response:
     workspace_id = resolve_workspace(x_workspace_id, x_workspace_key)
+    try:
+        req = msgspec.json.decode(await request.body(), type=ModerateRequest)
+    except msgspec.DecodeError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
     started = time.perf_counter()
     text = normalize_text(req.text or "")
 
     if text == "":
-        latency_ms = round((time.perf_counter() - started) * 1000)
-        return ModerateResponse(
-            action="allow",
-            score=0.0,
-            reason="empty_text",
-            matched_seed=None,
-            categories=empty_categories(),
-            flags=[],
-            policy={"block_threshold": BLOCK_THRESHOLD, "review_threshold": REVIEW_THRESHOLD},
-            provider="none",
-            model=None,
-            mode=req.mode,
-            latency_ms=latency_ms,
-        )
+        return encode_moderation(shortcut_result("allow", 0.0, "empty_text", req.mode, started))
+
+    if len(text) < MODERATION_MIN_CHARS:
+        shortcut_counts["too_short"] += 1
+        return encode_moderation(shortcut_result("allow", 0.0, "too_short", req.mode, started))
 
     if MOCK_MODE:
-        latency_ms = round((time.perf_counter() - started) * 1000)
-        return ModerateResponse(
-            action="allow",
-            score=0.05,
-            reason="mock_mode",
-            matched_seed=None,
-            categories=empty_categories(),
-            flags=["mock_mode"],
-            policy={"block_threshold": BLOCK_THRESHOLD, "review_threshold": REVIEW_THRESHOLD},
-            provider="mock",
-            model=None,
-            mode=req.mode,
-            latency_ms=latency_ms,
+        return encode_moderation(
+            shortcut_result("allow", 0.05, "mock_mode", req.mode, started, provider="mock", flags=["mock_mode"])
         )
 
     rule_categories, flags, rule_match = detect_rule_signals(text)
 
-    try:
-        llm_categories, llm_match, provider, model = run_llm_moderation(text)
-    except Exception as exc:
-        LOG.warning("Model moderation failed: %s", exc)
-        llm_categories, llm_match, provider, model = empty_categories(), None, "error", None
-        flags = sorted(set([*flags, "model_error"]))
+    rule_score = max(rule_categories.values())
+    if rule_score >= BLOCK_THRESHOLD:
+        llm_categories, llm_match, provider, model = empty_categories(), None, "rules", None
+    elif len(text) > MODERATION_MAX_MODEL_CHARS:
+        shortcut_counts["too_long"] += 1
+        response = shortcut_result(
+            "review",
+            round(max(rule_score, REVIEW_THRESHOLD), 4),
+            "too_long",
+            req.mode,
+            started,
+            provider="rules",
+            categories=merge_categories(rule_categories),
+            flags=sorted(set([*flags, "too_long"])),
+            matched_seed=rule_match,
+        )
+        return record_moderation(response, workspace_id, text)
+    else:
+        try:
+            llm_categories, llm_match, provider, model = await run_llm_moderation(text)
+        except Exception as exc:
+            LOG.warning("Model moderation failed: %s", exc)
+            llm_categories, llm_match, provider, model = empty_categories(), None, "error", None
+            flags = sorted(set([*flags, "model_error"]))
 
     categories = merge_categories(rule_categories, llm_categories)
     score = max(categories.values()) if categories else 0.0
@@ -196,20 +261,18 @@ def moderate(
         matched_seed=rule_match or llm_match,
         categories=categories,
         flags=flags,
-        policy={"block_threshold": BLOCK_THRESHOLD, "review_threshold": REVIEW_THRESHOLD},
+        policy=DEFAULT_POLICY,
         provider=provider,
         model=model,
         mode=req.mode,
         latency_ms=latency_ms,
     )
 
-    payload = response.model_dump() if hasattr(response, "model_dump") else response.dict()
-    log_event({"ts": int(time.time()), "workspace_id": workspace_id, "raw": text, **payload, "meta": {"environment": APP_ENV}})
-    return response
+    return record_moderation(response, workspace_id, text)
 
 
 @router.get("/admin/logs")
-def get_admin_logs(
+async def get_admin_logs(
     limit: int = 50,
     action: Optional[str] = None,
     x_workspace_id: Optional[str] = Header(default=None, alias="X-Workspace-Id"),
@@ -217,7 +280,7 @@ def get_admin_logs(
 ) -> dict[str, Any]:
     workspace_id = resolve_workspace(x_workspace_id, x_workspace_key)
     try:
-        items = fetch_events(limit=limit, action=action, workspace_id=workspace_id)
+        items = await fetch_events(limit=limit, action=action, workspace_id=workspace_id)
         return {"n": len(items), "results": items}
     except RuntimeError as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
@@ -227,7 +290,7 @@ def get_admin_logs(
 
 
 @router.post("/admin/review-submissions")
-def create_review_submission(
+async def create_review_submission(
     req: ReviewSubmissionRequest,
     x_workspace_id: Optional[str] = Header(default=None, alias="X-Workspace-Id"),
     x_workspace_key: Optional[str] = Header(default=None, alias="X-Workspace-Key"),
@@ -260,9 +323,9 @@ def create_review_submission(
                 ]
             )
         ),
-        "policy": req.moderation_result.get("policy", {"block_threshold": BLOCK_THRESHOLD, "review_threshold": REVIEW_THRESHOLD})
+        "policy": req.moderation_result.get("policy", DEFAULT_POLICY)
         if isinstance(req.moderation_result, dict)
-        else {"block_threshold": BLOCK_THRESHOLD, "review_threshold": REVIEW_THRESHOLD},
+        else DEFAULT_POLICY,
         "provider": req.moderation_result.get("provider", "manual") if isinstance(req.moderation_result, dict) else "manual",
         "model": req.moderation_result.get("model") if isinstance(req.moderation_result, dict) else None,
         "mode": req.mode,
@@ -277,14 +340,14 @@ def create_review_submission(
         },
     }
 
-    if not save_event(event):
+    if not await save_event(event):
         raise HTTPException(status_code=500, detail="Failed to save review submission")
 
     return {"ok": True, "saved_at": now, "event": event}
 
 
 @router.post("/admin/logs/{event_id}/decision")
-def apply_review_decision(
+async def apply_review_decision(
     event_id: str,
     req: ReviewDecisionRequest,
     x_workspace_id: Optional[str] = Header(default=None, alias="X-Workspace-Id"),
@@ -312,7 +375,7 @@ def apply_review_decision(
         updates["action"] = action_override
 
     try:
-        event = update_event(event_id, updates, workspace_id=workspace_id)
+        event = await update_event(event_id, updates, workspace_id=workspace_id)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
     except RuntimeError as exc:
@@ -328,14 +391,14 @@ def apply_review_decision(
 
 
 @router.get("/admin/analytics")
-def get_admin_analytics(
+async def get_admin_analytics(
     limit: int = 500,
     x_workspace_id: Optional[str] = Header(default=None, alias="X-Workspace-Id"),
     x_workspace_key: Optional[str] = Header(default=None, alias="X-Workspace-Key"),
 ) -> dict[str, Any]:
     workspace_id = resolve_workspace(x_workspace_id, x_workspace_key)
     try:
-        events = fetch_all_events(limit=limit, workspace_id=workspace_id)
+        events = await fetch_all_events(limit=limit, workspace_id=workspace_id)
     except RuntimeError as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
     except Exception as exc:
@@ -348,9 +411,10 @@ def get_admin_analytics(
     flag_counts: dict[str, int] = {}
 
     for event in events:
+        weight = int(event.get("count") or 1)
         action = event.get("action")
         if action in action_counts:
-            action_counts[action] += 1
+            action_counts[action] += weight
 
         status = event.get("review_status") or ("decided" if event.get("review") else "open" if action == "review" else "resolved")
         if status in status_counts:
@@ -360,10 +424,10 @@ def get_admin_analytics(
         if categories:
             top_category = max(categories, key=lambda key: float(categories.get(key, 0.0)))
             if float(categories.get(top_category, 0.0)) > 0:
-                category_counts[top_category] = category_counts.get(top_category, 0) + 1
+                category_counts[top_category] = category_counts.get(top_category, 0) + weight
 
         for flag in event.get("flags") or []:
-            flag_counts[flag] = flag_counts.get(flag, 0) + 1
+            flag_counts[flag] = flag_counts.get(flag, 0) + weight
 
     top_categories = sorted(category_counts.items(), key=lambda item: item[1], reverse=True)[:5]
     top_flags = sorted(flag_counts.items(), key=lambda item: item[1], reverse=True)[:5]
@@ -372,12 +436,12 @@ def get_admin_analytics(
     per_day: dict[str, int] = {}
     for event in events:
         day = time.strftime("%Y-%m-%d", time.gmtime(event.get("ts", 0)))
-        per_day[day] = per_day.get(day, 0) + 1
+        per_day[day] = per_day.get(day, 0) + int(event.get("count") or 1)
     for day, count in sorted(per_day.items())[-7:]:
         trend.append({"day": day, "count": count})
 
     return {
-        "total_events": len(events),
+        "total_events": sum(int(event.get("count") or 1) for event in events),
         "status_counts": status_counts,
         "action_counts": action_counts,
         "top_categories": [{"name": name, "count": count} for name, count in top_categories],
@@ -387,14 +451,14 @@ def get_admin_analytics(
 
 
 @router.get("/admin/test-cases")
-def get_saved_test_cases(
+async def get_saved_test_cases(
     limit: int = 100,
     x_workspace_id: Optional[str] = Header(default=None, alias="X-Workspace-Id"),
     x_workspace_key: Optional[str] = Header(default=None, alias="X-Workspace-Key"),
 ) -> dict[str, Any]:
     workspace_id = resolve_workspace(x_workspace_id, x_workspace_key)
     try:
-        items = fetch_test_cases(limit=limit, workspace_id=workspace_id)
+        items = await fetch_test_cases(limit=limit, workspace_id=workspace_id)
         return {"n": len(items), "results": items}
     except RuntimeError as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
@@ -404,7 +468,7 @@ def get_saved_test_cases(
 
 
 @router.post("/admin/test-cases")
-def create_test_case(
+async def create_test_case(
     req: TestCaseRequest,
     x_workspace_id: Optional[str] = Header(default=None, alias="X-Workspace-Id"),
     x_workspace_key: Optional[str] = Header(default=None, alias="X-Workspace-Key"),
@@ -427,7 +491,7 @@ def create_test_case(
         raise HTTPException(status_code=400, detail="Title and text are required")
 
     try:
-        saved = save_test_case(document)
+        saved = await save_test_case(document)
     except RuntimeError as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
     except Exception as exc:
@@ -441,13 +505,13 @@ def create_test_case(
 
 
 @router.get("/admin/test-cases/export")
-def export_test_cases(
+async def export_test_cases(
     x_workspace_id: Optional[str] = Header(default=None, alias="X-Workspace-Id"),
     x_workspace_key: Optional[str] = Header(default=None, alias="X-Workspace-Key"),
 ) -> dict[str, Any]:
     workspace_id = resolve_workspace(x_workspace_id, x_workspace_key)
     try:
-        items = fetch_test_cases(limit=1000, workspace_id=workspace_id)
+        items = await fetch_test_cases(limit=1000, workspace_id=workspace_id)
     except RuntimeError as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
     except Exception as exc:
@@ -471,7 +535,7 @@ def export_test_cases(
 
 
 @router.post("/admin/test-cases/import")
-def import_test_cases(
+async def import_test_cases(
     req: TestCaseImportRequest,
     x_workspace_id: Optional[str] = Header(default=None, alias="X-Workspace-Id"),
     x_workspace_key: Optional[str] = Header(default=None, alias="X-Workspace-Key"),
@@ -492,20 +556,20 @@ def import_test_cases(
             "created_at": now,
             "meta": {"source": "import", "environment": APP_ENV},
         }
-        saved = save_test_case(document)
+        saved = await save_test_case(document)
         if saved is not None:
             created.append(saved)
     return {"ok": True, "imported": len(created), "results": created}
 
 
 @router.get("/admin/policy-presets")
-def get_policy_presets(
+async def get_policy_presets(
     x_workspace_id: Optional[str] = Header(default=None, alias="X-Workspace-Id"),
     x_workspace_key: Optional[str] = Header(default=None, alias="X-Workspace-Key"),
 ) -> dict[str, Any]:
     workspace_id = resolve_workspace(x_workspace_id, x_workspace_key)
     try:
-        items = fetch_policy_presets(workspace_id=workspace_id)
+        items = await fetch_policy_presets(workspace_id=workspace_id)
         return {"n": len(items), "results": items}
     except RuntimeError as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
@@ -515,7 +579,7 @@ def get_policy_presets(
 
 
 @router.post("/admin/policy-presets")
-def upsert_preset(
+async def upsert_preset(
     req: PolicyPresetRequest,
     x_workspace_id: Optional[str] = Header(default=None, alias="X-Workspace-Id"),
     x_workspace_key: Optional[str] = Header(default=None, alias="X-Workspace-Key"),
@@ -533,7 +597,7 @@ def upsert_preset(
         "updated_at": int(time.time()),
     }
     try:
-        saved = upsert_policy_preset(workspace_id, req.preset_id, document)
+        saved = await upsert_policy_preset(workspace_id, req.preset_id, document)
     except RuntimeError as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
     except Exception as exc:
@@ -545,7 +609,7 @@ def upsert_preset(
 
 
 @router.post("/admin/logs/{event_id}/assign")
-def assign_review_owner(
+async def assign_review_owner(
     event_id: str,
     req: ReviewAssignmentRequest,
     x_workspace_id: Optional[str] = Header(default=None, alias="X-Workspace-Id"),
@@ -561,7 +625,7 @@ def assign_review_owner(
         },
     }
     try:
-        event = update_event(event_id, updates, workspace_id=workspace_id)
+        event = await update_event(event_id, updates, workspace_id=workspace_id)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
     except RuntimeError as exc:
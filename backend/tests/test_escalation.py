@@ -0,0 +1,24 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+import providers
+
+
+@pytest.mark.skipif(not providers.ESCALATION_ENABLED, reason="escalation disabled")
+def test_failed_escalation_keeps_fast_model_verdict(monkeypatch):
+    async def fast_verdict(text):
+        return {"label": "harassment", "score": 0.6, "matched_seed": "idiot"}
+
+    async def failing_escalation(text, model=providers.GROQ_MODEL):
+        raise RuntimeError("429")
+
+    monkeypatch.setattr(providers, "groq_client", SimpleNamespace())
+    monkeypatch.setattr(providers, "request_groq_moderation", fast_verdict)
+    monkeypatch.setattr(providers, "_groq_moderate_one", failing_escalation)
+
+    categories, matched_seed, provider, model = asyncio.run(providers._query_llm("you idiot"))
+    assert categories["harassment"] == 0.6
+    assert matched_seed == "idiot"
+    assert (provider, model) == ("groq", providers.GROQ_MODEL)
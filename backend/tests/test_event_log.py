@@ -0,0 +1,31 @@
+import providers
+
+
+def test_repeat_blocks_merge_only_into_unreviewed_documents():
+    events = [
+        {"ts": 1, "workspace_id": "w", "raw": "spam", "action": "block"},
+        {"ts": 2, "workspace_id": "w", "raw": "spam", "action": "block"},
+        {"ts": 3, "workspace_id": "w", "raw": "fine", "action": "allow"},
+    ]
+    ops = providers._event_write_ops(events)
+
+    inserts = [op for op in ops if isinstance(op, providers.InsertOne)]
+    upserts = [op for op in ops if isinstance(op, providers.UpdateOne)]
+    assert len(inserts) == 1
+    assert len(upserts) == 1
+
+    assert upserts[0] == providers.UpdateOne(
+        {"fingerprint": providers.event_fingerprint(events[0]), "review": {"$exists": False}},
+        {
+            "$set": {"ts": 2, "workspace_id": "w", "raw": "spam"},
+            "$inc": {"count": 2},
+            "$setOnInsert": {"first_ts": 1, "action": "block"},
+        },
+        upsert=True,
+    )
+
+
+def test_fingerprint_is_scoped_to_workspace():
+    first = {"workspace_id": "a", "raw": "spam"}
+    second = {"workspace_id": "b", "raw": "spam"}
+    assert providers.event_fingerprint(first) != providers.event_fingerprint(second)
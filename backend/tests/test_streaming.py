@@ -0,0 +1,83 @@
+import asyncio
+from types import SimpleNamespace
+
+import providers
+
+
+class FakeStream:
+    def __init__(self, text: str, chunk_size: int = 4):
+        self.parts = [text[i : i + chunk_size] for i in range(0, len(text), chunk_size)]
+        self.read = 0
+        self.closed = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self.parts:
+            raise StopAsyncIteration
+        self.read += 1
+        delta = SimpleNamespace(content=self.parts.pop(0))
+        return SimpleNamespace(choices=[SimpleNamespace(delta=delta)])
+
+    async def close(self):
+        self.closed = True
+
+
+def fake_groq(stream: FakeStream):
+    async def create(**kwargs):
+        return stream
+
+    return SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+
+
+def run_one(monkeypatch, text: str, model: str = providers.GROQ_MODEL):
+    stream = FakeStream(text)
+    monkeypatch.setattr(providers, "groq_client", fake_groq(stream))
+
+    async def call():
+        monkeypatch.setattr(providers, "upstream_slots", asyncio.Semaphore(1))
+        return await providers._groq_moderate_one("message", model=model)
+
+    return asyncio.run(call()), stream
+
+
+def test_early_decision_waits_for_label_and_complete_score():
+    assert providers._early_decision('{"label":"hate","score":0.9', False) is None
+    assert providers._early_decision('{"score":0.99,', False) is None
+    assert providers._early_decision('{"label":"hate","score":0.99,', False) == {
+        "label": "hate",
+        "score": 0.99,
+        "matched_seed": None,
+    }
+
+
+def test_early_decision_skips_borderline_and_unknown_labels():
+    assert providers._early_decision('{"label":"hate","score":0.6,', False) is None
+    assert providers._early_decision('{"label":"threat","score":0.95,', False) is None
+    assert providers._early_decision('{"label":"threat","score":0.01,', False) is None
+
+
+def test_early_decision_holds_escalation_band_while_escalating():
+    buffer = f'{{"label":"hate","score":{providers.BLOCK_THRESHOLD},'
+    assert providers._early_decision(buffer, True) is None
+    assert providers._early_decision(buffer, False) is not None
+
+
+def test_moderate_one_stops_stream_on_decisive_score(monkeypatch):
+    text = '{"label":"hate","score":0.99,"matched_seed":"x","categories":{"hate":0.99}}'
+    payload, stream = run_one(monkeypatch, text, model=providers.GROQ_ESCALATION_MODEL or "other-model")
+    assert payload == {"label": "hate", "score": 0.99, "matched_seed": None}
+    assert stream.parts
+    assert stream.closed
+
+
+def test_moderate_one_reads_full_object_for_unknown_label(monkeypatch):
+    text = '{"label":"threat","score":0.95,"matched_seed":null,"categories":{"violence":0.95}}'
+    payload, stream = run_one(monkeypatch, text, model=providers.GROQ_ESCALATION_MODEL or "other-model")
+    assert payload["categories"] == {"violence": 0.95}
+    assert not stream.parts
+    assert stream.closed
+
+    categories, _ = providers.parse_llm_payload(payload)
+    assert categories["violence"] == 0.95